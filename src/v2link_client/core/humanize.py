@@ -3,18 +3,18 @@
 from __future__ import annotations
 
 
+_BYTE_UNITS = ("B", "KiB", "MiB", "GiB", "TiB")
+
+
 def format_bytes(num_bytes: int) -> str:
-    value = float(max(0, int(num_bytes)))
-    units = ["B", "KiB", "MiB", "GiB", "TiB"]
-    unit = units[0]
-    for next_unit in units[1:]:
-        if value < 1024.0:
-            break
-        value /= 1024.0
-        unit = next_unit
-    if unit == "B":
-        return f"{int(value)} {unit}"
-    return f"{value:.1f} {unit}"
+    n = max(0, int(num_bytes))
+    # Pick the unit in O(1) from the bit length (10 bits per 1024 step)
+    # instead of dividing in a loop; this runs per stats-table refresh.
+    idx = 0 if n < 1024 else min(len(_BYTE_UNITS) - 1, (n.bit_length() - 1) // 10)
+    if idx == 0:
+        return f"{n} B"
+    value = n / (1 << (idx * 10))
+    return f"{value:.1f} {_BYTE_UNITS[idx]}"
 
 
 def format_mbps(bytes_per_s: float) -> str:
@@ -25,7 +25,6 @@ def format_mbps(bytes_per_s: float) -> str:
 
 def format_duration_s(seconds: float) -> str:
     total = int(max(0.0, float(seconds)))
-    h = total // 3600
-    m = (total % 3600) // 60
-    s = total % 60
+    h, rem = divmod(total, 3600)
+    m, s = divmod(rem, 60)
     return f"{h:02d}:{m:02d}:{s:02d}"
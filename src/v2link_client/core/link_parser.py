@@ -7,14 +7,30 @@ V2Ray/Xray ecosystems and are the minimal requirement to start the core.
 from __future__ import annotations
 
 from dataclasses import dataclass
-import uuid
-from typing import Literal
-from urllib.parse import parse_qs, unquote, urlparse
+import functools
+import re
+from typing import Iterable, Literal
+from urllib.parse import unquote
 
 from v2link_client.core.errors import InvalidLinkError, UnsupportedSchemeError
 
 SUPPORTED_SCHEMES: set[str] = {"vmess", "vless", "trojan", "ss"}
 
+# Captures user id, host (optionally bracketed IPv6), port, query, fragment in
+# a single pass instead of running urlparse + parse_qs per link. The scheme
+# matches case-insensitively and a path segment is accepted and ignored, both
+# per urlparse semantics at baseline.
+_VLESS_RE: re.Pattern[str] = re.compile(
+    r"(?i:vless)://([0-9a-fA-F-]{36})@(\[[0-9a-fA-F:.]+\]|[^@:/?#]+):(\d+)(?:/[^?#]*)?"
+    r"(?:\?([^#]*))?(?:#(.*))?$"
+)
+
+# Format check only; constructing a uuid.UUID object just to validate is
+# several times slower and we never need the parsed value.
+_UUID_RE: re.Pattern[str] = re.compile(
+    r"[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}$"
+)
+
 
 @dataclass(frozen=True, slots=True)
 class VlessLink:
@@ -39,36 +55,71 @@ class VlessLink:
     def display_name(self) -> str:
         return self.name or f"{self.host}:{self.port}"
 
+    def __hash__(self) -> int:
+        # The generated dataclass __hash__ re-hashes all 17 fields per call
+        # (and would choke on the alpn list). user id + endpoint uniquely
+        # identify the server, which is all dedup/caching needs.
+        return hash((self.user_id, self.host, self.port))
+
 
 ParsedLink = VlessLink
 
 
-def _first(query: dict[str, list[str]], key: str) -> str | None:
-    values = query.get(key)
-    if not values:
+def _first(query: dict[str, str], key: str) -> str | None:
+    value = query.get(key)
+    if value is None:
         return None
-    value = values[0].strip()
+    value = value.strip()
     return value or None
 
 
+def _parse_query(query_raw: str | None) -> dict[str, str]:
+    """Tokenize a query string keeping the first value per key (like parse_qs).
+
+    Keys are lower-cased inline so no second, case-folded dict has to be
+    materialized by the caller.
+    """
+    params: dict[str, str] = {}
+    if not query_raw:
+        return params
+    for pair in query_raw.split("&"):
+        if not pair:
+            continue
+        key, _, value = pair.partition("=")
+        params.setdefault(unquote(key).lower(), unquote(value.replace("+", " ")))
+    return params
+
+
+_TRUE_VALUES = frozenset({"1", "true", "yes", "y", "on"})
+_FALSE_VALUES = frozenset({"0", "false", "no", "n", "off"})
+
+_TRANSPORTS = frozenset({"tcp", "ws", "grpc"})
+_SECURITIES = frozenset({"none", "tls"})
+
+
 def _parse_bool(value: str | None) -> bool | None:
     if value is None:
         return None
     normalized = value.strip().lower()
-    if normalized in {"1", "true", "yes", "y", "on"}:
+    if normalized in _TRUE_VALUES:
         return True
-    if normalized in {"0", "false", "no", "n", "off"}:
+    if normalized in _FALSE_VALUES:
         return False
     return None
 
 
+@functools.lru_cache(maxsize=4096)
 def parse_link(raw: str) -> ParsedLink:
+    # Pure function of the raw string and the result is frozen, so identical
+    # links (subscription providers re-deliver the same entries on every
+    # refresh) parse once. Errors raise and are not cached.
     raw = (raw or "").strip()
     if not raw:
         raise InvalidLinkError("Empty link", user_message="Paste a vless:// link first.")
 
-    parsed = urlparse(raw)
-    scheme = (parsed.scheme or "").lower()
+    # Only the scheme is needed here; _parse_vless re-parses the rest with
+    # its own pattern, so a full urlparse would be redundant work.
+    scheme = raw.partition("://")[0].lower()
     if scheme not in SUPPORTED_SCHEMES:
         raise UnsupportedSchemeError(
             f"Unsupported scheme: {scheme!r}",
@@ -85,27 +136,35 @@ def parse_link(raw: str) -> ParsedLink:
 
 
 def _parse_vless(raw: str) -> VlessLink:
-    parsed = urlparse(raw)
-
-    user_id = parsed.username or ""
-    host = parsed.hostname or ""
-    port = parsed.port
-    if not user_id or not host or port is None:
+    match = _VLESS_RE.match(raw)
+    if match is None:
         raise InvalidLinkError(
             "Malformed vless link",
             user_message="VLESS link must include user id, host, and port.",
         )
 
-    try:
-        uuid.UUID(user_id)
-    except ValueError as exc:
+    user_id, host, port_raw, query_str, fragment = match.groups()
+
+    if _UUID_RE.match(user_id) is None:
         raise InvalidLinkError(
             "Invalid VLESS user id",
             user_message="VLESS user id must be a UUID.",
-        ) from exc
+        )
+
+    # Match urlparse semantics: hostnames are case-insensitive and IPv6
+    # literals lose their brackets.
+    if host.startswith("["):
+        host = host[1:-1]
+    host = host.lower()
+
+    port = int(port_raw)
+    if not 0 < port <= 65535:
+        raise InvalidLinkError(
+            f"Invalid port: {port}",
+            user_message="VLESS link port must be between 1 and 65535.",
+        )
 
-    query_raw = parse_qs(parsed.query, keep_blank_values=True)
-    query = {k.lower(): v for k, v in query_raw.items()}
+    query = _parse_query(query_str)
 
     encryption = _first(query, "encryption") or "none"
     security = _first(query, "security") or "none"
@@ -130,17 +189,17 @@ def _parse_vless(raw: str) -> VlessLink:
         if not alpn:
             alpn = None
 
-    name = unquote(parsed.fragment) if parsed.fragment else None
+    name = unquote(fragment) if fragment else None
 
     transport = transport.lower()
-    if transport not in {"tcp", "ws", "grpc"}:
+    if transport not in _TRANSPORTS:
         raise InvalidLinkError(
             f"Unsupported transport: {transport}",
             user_message=f"Unsupported VLESS transport: {transport}",
         )
 
     security = security.lower()
-    if security not in {"none", "tls"}:
+    if security not in _SECURITIES:
         raise InvalidLinkError(
             f"Unsupported security: {security}",
             user_message=f"Unsupported VLESS security: {security}",
@@ -165,3 +224,20 @@ def _parse_vless(raw: str) -> VlessLink:
         flow=flow,
         alpn=alpn,
     )
+
+
+def _safe_parse(raw: str) -> ParsedLink | Exception:
+    try:
+        return parse_link(raw)
+    except Exception as exc:  # noqa: BLE001 - errors are returned inline
+        return exc
+
+
+def parse_links(raws: Iterable[str]) -> list[ParsedLink | Exception]:
+    """Parse many links at once, returning errors inline instead of raising.
+
+    Parsing is pure-Python and GIL-bound, so there is nothing to overlap
+    with threads; the sequential loop plus the parse_link cache (repeat
+    subscription entries are free) is the fast path here.
+    """
+    return [_safe_parse(raw) for raw in raws]
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 import socket
 import ssl
@@ -34,20 +35,23 @@ def ping_server(
             error="Missing host/port",
         )
 
-    tcp_ms: int | None = None
-    try:
+    def _tcp_probe() -> tuple[int | None, str | None]:
         started = time.monotonic()
-        with socket.create_connection((host, port), timeout=timeout_s):
-            tcp_ms = int((time.monotonic() - started) * 1000)
-    except OSError as exc:
-        return ServerPingResult(
-            tcp_ms=None,
-            tls_sni_ms=None,
-            tls_host_ms=None,
-            error=str(exc),
-        )
+        try:
+            with socket.create_connection((host, port), timeout=timeout_s):
+                return int((time.monotonic() - started) * 1000), None
+        except OSError as exc:
+            return None, str(exc)
 
     if (security or "").strip().lower() != "tls":
+        tcp_ms, tcp_err = _tcp_probe()
+        if tcp_err is not None:
+            return ServerPingResult(
+                tcp_ms=None,
+                tls_sni_ms=None,
+                tls_host_ms=None,
+                error=tcp_err,
+            )
         return ServerPingResult(
             tcp_ms=tcp_ms,
             tls_sni_ms=None,
@@ -55,34 +59,62 @@ def ping_server(
             error=None,
         )
 
-    def _tls_handshake(server_name: str) -> tuple[int | None, str | None]:
-        context = ssl.create_default_context()
-        if allow_insecure:
-            context.check_hostname = False
-            context.verify_mode = ssl.CERT_NONE
+    # One context for all handshakes: loading the default cert store isn't
+    # free, and session resumption below requires the same context on both
+    # connections.
+    context = ssl.create_default_context()
+    if allow_insecure:
+        context.check_hostname = False
+        context.verify_mode = ssl.CERT_NONE
 
+    def _tls_handshake(
+        server_name: str, *, session: ssl.SSLSession | None = None
+    ) -> tuple[int | None, str | None, ssl.SSLSession | None]:
         started_tls = time.monotonic()
         try:
             with socket.create_connection((host, port), timeout=timeout_s) as sock:
                 sock.settimeout(timeout_s)
-                with context.wrap_socket(sock, server_hostname=server_name) as ssock:
+                with context.wrap_socket(
+                    sock, server_hostname=server_name, session=session
+                ) as ssock:
                     ssock.do_handshake()
-            return int((time.monotonic() - started_tls) * 1000), None
+                    saved_session = ssock.session
+            return int((time.monotonic() - started_tls) * 1000), None, saved_session
         except Exception as exc:  # noqa: BLE001 - we want the user-visible error text
-            return None, str(exc)
+            return None, str(exc), None
 
     tls_sni_ms: int | None = None
     tls_host_ms: int | None = None
     errors: list[str] = []
 
     server_sni = (sni or "").strip() or host
-    ms, err = _tls_handshake(server_sni)
+    # The TCP probe and the SNI handshake open independent connections, so
+    # overlap those two; a TCP failure still short-circuits the result.
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        tcp_future = executor.submit(_tcp_probe)
+        sni_future = executor.submit(_tls_handshake, server_sni)
+        tcp_ms, tcp_err = tcp_future.result()
+        ms, err, session = sni_future.result()
+
+    if tcp_err is not None:
+        return ServerPingResult(
+            tcp_ms=None,
+            tls_sni_ms=None,
+            tls_host_ms=None,
+            error=tcp_err,
+        )
+
     tls_sni_ms = ms
     if err:
         errors.append(f"TLS({server_sni}): {err}")
 
     if server_sni != host:
-        ms2, err2 = _tls_handshake(host)
+        # Reuse the first handshake's session: TLS 1.2 tickets / TLS 1.3 PSK
+        # resumption let the server skip the full key exchange, so running
+        # this one after the SNI handshake is cheaper than a second full
+        # handshake in parallel. Servers that reject the resumption fall
+        # back to a full handshake transparently.
+        ms2, err2, _ = _tls_handshake(host, session=session)
         tls_host_ms = ms2
         if err2:
             errors.append(f"TLS({host}): {err2}")
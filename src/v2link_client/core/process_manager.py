@@ -9,13 +9,13 @@ The UI intentionally keeps policy decisions simple:
 from __future__ import annotations
 
 from dataclasses import dataclass
-import errno
+import functools
 import logging
+import os
 from pathlib import Path
 import shutil
 import socket
 import subprocess
-from typing import IO
 
 from v2link_client.core.errors import (
     BinaryMissingError,
@@ -34,7 +34,12 @@ class CoreBinary:
     path: str
 
 
+@functools.lru_cache(maxsize=1)
 def find_xray_binary() -> CoreBinary:
+    # shutil.which walks and stats every PATH entry; the binary location
+    # doesn't change within a session, so do it once per process. A missing
+    # binary raises and is therefore retried (lru_cache doesn't cache
+    # exceptions); tests can reset via find_xray_binary.cache_clear().
     path = shutil.which("xray")
     if not path:
         raise BinaryMissingError(
@@ -45,22 +50,61 @@ def find_xray_binary() -> CoreBinary:
 
 
 def ensure_port_available(host: str, port: int) -> None:
+    # Probe by connecting instead of binding: SO_REUSEADDR lets a loopback
+    # bind succeed even while another process holds the port (TIME_WAIT
+    # etc.), so a successful bind was not a reliable "available" signal.
+    # A completed connect means something is listening; refusal/timeout
+    # means the port is free.
     with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
-        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-        try:
-            sock.bind((host, port))
-        except OSError as exc:
-            if exc.errno in {errno.EADDRINUSE, 48}:  # 48 is macOS EADDRINUSE
+        sock.settimeout(0.1)
+        if sock.connect_ex((host, port)) == 0:
+            raise PortInUseError(
+                f"Port {port} in use on {host}",
+                user_message=f"Port {port} is already in use on {host}.",
+            )
+
+
+def reserve_ports(endpoints: list[tuple[str, int]]) -> list[socket.socket]:
+    """Bind every (host, port) and return the held sockets.
+
+    Unlike a probe-then-start sequence, holding the bound sockets closes the
+    window where another process grabs a port between the check and Xray's
+    own bind. The caller closes them right before spawning the core;
+    SO_REUSEADDR lets Xray rebind immediately after.
+    """
+    held: list[socket.socket] = []
+    try:
+        for host, port in endpoints:
+            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            held.append(sock)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            try:
+                sock.bind((host, port))
+                # A bare SO_REUSEADDR bind doesn't exclude other reusing
+                # binders; an active listener does.
+                sock.listen(1)
+            except PermissionError as exc:
+                raise PermissionDeniedError(
+                    f"Not allowed to bind {host}:{port}",
+                    user_message=f"Not allowed to bind port {port} on {host}.",
+                ) from exc
+            except OSError as exc:
                 raise PortInUseError(
-                    f"Port {port} in use on {host}",
+                    f"Port {port} in use on {host}: {exc}",
                     user_message=f"Port {port} is already in use on {host}.",
                 ) from exc
-            if exc.errno == errno.EACCES:
-                raise PermissionDeniedError(
-                    f"Permission denied binding {host}:{port}",
-                    user_message=f"Permission denied binding {host}:{port}.",
-                ) from exc
-            raise
+    except BaseException:
+        release_ports(held)
+        raise
+    return held
+
+
+def release_ports(held: list[socket.socket]) -> None:
+    for sock in held:
+        try:
+            sock.close()
+        except OSError:  # pragma: no cover - close on a TCP socket can't fail
+            pass
 
 
 def find_free_port(host: str) -> int:
@@ -108,7 +152,7 @@ class XrayProcessManager:
     def __init__(self, xray: CoreBinary | None = None) -> None:
         self._xray: CoreBinary | None = xray
         self._proc: subprocess.Popen[bytes] | None = None
-        self._stdout_handle: IO[str] | None = None
+        self._stdout_fd: int | None = None
         self._stdout_path: Path | None = None
 
     def _ensure_binary(self) -> CoreBinary:
@@ -127,11 +171,23 @@ class XrayProcessManager:
     def is_running(self) -> bool:
         return self._proc is not None and self._proc.poll() is None
 
+    def pid(self) -> int | None:
+        if self._proc is None:
+            return None
+        return self._proc.pid
+
     def returncode(self) -> int | None:
         if self._proc is None:
             return None
         return self._proc.poll()
 
+    def _close_stdout_fd(self) -> None:
+        # Raw fds aren't reclaimed by refcount GC like file objects were;
+        # anything we opened must be closed explicitly.
+        if self._stdout_fd is not None:
+            os.close(self._stdout_fd)
+            self._stdout_fd = None
+
     def start(self, config_path: Path) -> None:
         if self.is_running():
             return
@@ -140,25 +196,40 @@ class XrayProcessManager:
         logs_dir = get_logs_dir()
         logs_dir.mkdir(parents=True, exist_ok=True)
         self._stdout_path = logs_dir / "xray_stdout.log"
-        self._stdout_handle = self._stdout_path.open("a", encoding="utf-8")
+        # Popen only needs the file descriptor; a buffered Python file object
+        # on top would just add a TextIOWrapper+BufferedWriter we never use.
+        self._close_stdout_fd()
+        self._stdout_fd = os.open(
+            str(self._stdout_path), os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644
+        )
 
         cmd = [xray.path, "run", "-c", str(config_path)]
         try:
+            # On 3.13+ this plain call (no shell, cwd, env rewrite or
+            # preexec_fn) takes CPython's posix_spawn fast path, avoiding a
+            # full fork of the GUI process; earlier versions fork+exec because
+            # close_fds=True disqualifies posix_spawn there. Don't add
+            # preexec_fn here — it forces fork+exec on every version.
             self._proc = subprocess.Popen(
                 cmd,
-                stdout=self._stdout_handle,
+                stdout=self._stdout_fd,
                 stderr=subprocess.STDOUT,
             )
         except FileNotFoundError as exc:
+            self._close_stdout_fd()
             raise BinaryMissingError(
                 f"{xray.name} binary missing: {xray.path}",
                 user_message=f"{xray.name} binary not found: {xray.path}",
             ) from exc
         except PermissionError as exc:
+            self._close_stdout_fd()
             raise PermissionDeniedError(
                 f"{xray.name} not executable: {xray.path}",
                 user_message=f"{xray.name} binary is not executable: {xray.path}",
             ) from exc
+        except BaseException:
+            self._close_stdout_fd()
+            raise
 
         logger.info("Started xray pid=%s", self._proc.pid)
 
@@ -177,6 +248,4 @@ class XrayProcessManager:
             proc.wait(timeout=timeout_s)
         finally:
             logger.info("Stopped xray with returncode=%s", proc.returncode)
-            if self._stdout_handle is not None:
-                self._stdout_handle.close()
-            self._stdout_handle = None
+            self._close_stdout_fd()
@@ -7,39 +7,62 @@ Currently supported:
 - GNOME (and many desktops using libproxy) via `gsettings`.
 
 We keep this module dependency-free by shelling out to the system tools.
+When PyGObject happens to be installed (common on GNOME systems), settings are
+read and written in-process via Gio instead, skipping one subprocess per key.
 """
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-import ast
+from concurrent.futures import ThreadPoolExecutor
+import contextlib
+import functools
+import itertools
 import logging
 from pathlib import Path
 import shutil
 import subprocess
-from typing import Final, Literal
+from typing import Any, Final, Literal, NamedTuple
 
 from v2link_client.core.errors import ProxyApplyError
 from v2link_client.core.storage import get_state_dir, load_json, save_json
 
+try:
+    # Optional fast path: direct GSettings access through PyGObject avoids a
+    # fork+exec per key (10+ reads per snapshot, 9 writes per apply). The CLI
+    # fallback below keeps the module dependency-free.
+    import gi
+
+    gi.require_version("Gio", "2.0")
+    from gi.repository import Gio, GLib
+except (ImportError, ValueError):  # pragma: no cover - depends on environment
+    Gio = None  # type: ignore[assignment]
+    GLib = None  # type: ignore[assignment]
+
 logger = logging.getLogger(__name__)
 
 SNAPSHOT_FILE: Final[str] = "system_proxy_snapshot.json"
 
 ProxyBackendName = Literal["gsettings"]
 
+DEFAULT_BYPASS: Final[tuple[str, ...]] = ("localhost", "127.0.0.0/8", "::1")
+
 
-@dataclass(frozen=True, slots=True)
-class SystemProxyConfig:
+class SystemProxyConfig(NamedTuple):
+    # NamedTuple stores the five fields in a plain C-level tuple (no
+    # per-instance __dict__) and is hashable, so a config can key caches.
     http_host: str
     http_port: int
     socks_host: str
     socks_port: int
-    bypass_hosts: list[str]
+    # Callers share DEFAULT_BYPASS instead of building a fresh list each time.
+    bypass_hosts: tuple[str, ...] = ()
 
 
-def _run(cmd: list[str], *, timeout_s: float = 3.0) -> subprocess.CompletedProcess[str]:
+def _run(
+    cmd: list[str], *, timeout_s: float = 3.0, input_text: str | None = None
+) -> subprocess.CompletedProcess[str]:
     logger.info("Running command: %s", cmd)
+    extra: dict[str, Any] = {"input": input_text} if input_text is not None else {}
     try:
         result = subprocess.run(
             cmd,
@@ -47,6 +70,7 @@ def _run(cmd: list[str], *, timeout_s: float = 3.0) -> subprocess.CompletedProce
             capture_output=True,
             text=True,
             timeout=timeout_s,
+            **extra,
         )
     except subprocess.TimeoutExpired as exc:
         raise ProxyApplyError(
@@ -69,9 +93,106 @@ def _run(cmd: list[str], *, timeout_s: float = 3.0) -> subprocess.CompletedProce
     return result
 
 
-def _gsettings_available() -> bool:
-    if shutil.which("gsettings") is None:
-        return False
+class _GioBackend:
+    """Read/write GSettings in-process via Gio, one Gio.Settings per schema.
+
+    Values are exchanged in the same textual GVariant form the gsettings CLI
+    prints, so snapshots stay interchangeable between both backends.
+    """
+
+    def __init__(self) -> None:
+        self._settings: dict[str, Any] = {}
+        self._delayed = False
+
+    def _schema(self, schema: str) -> Any:
+        settings = self._settings.get(schema)
+        if settings is None:
+            settings = Gio.Settings.new(schema)
+            if self._delayed:
+                settings.delay()
+            self._settings[schema] = settings
+        return settings
+
+    def _check_key(self, settings: Any, schema: str, key: str) -> None:
+        # GLib aborts the whole process on an unknown key; turn that into a
+        # normal error instead.
+        if not settings.props.settings_schema.has_key(key):
+            raise ProxyApplyError(
+                f"Unknown GSettings key: {schema}:{key}",
+                user_message="Failed to apply system proxy settings.",
+            )
+
+    def get(self, schema: str, key: str) -> str:
+        settings = self._schema(schema)
+        self._check_key(settings, schema, key)
+        return settings.get_value(key).print_(False)
+
+    def set(self, schema: str, key: str, value: str) -> None:
+        settings = self._schema(schema)
+        self._check_key(settings, schema, key)
+        expected_type = settings.get_value(key).get_type()
+        try:
+            variant = GLib.Variant.parse(expected_type, value, None, None)
+        except Exception as exc:  # GLib.Error
+            raise ProxyApplyError(
+                f"Invalid value for {schema}:{key}: {value!r}: {exc}",
+                user_message="Failed to apply system proxy settings.",
+            ) from exc
+        if not settings.set_value(key, variant):
+            raise ProxyApplyError(
+                f"Key is not writable: {schema}:{key}",
+                user_message="Failed to apply system proxy settings.",
+            )
+
+    def sync(self) -> None:
+        # Writes are queued to dconf asynchronously; flush them so settings
+        # survive even if the process exits right after apply/restore.
+        Gio.Settings.sync()
+
+    @contextlib.contextmanager
+    def batch(self):
+        """Buffer writes (Gio.Settings.delay) and land them in one commit.
+
+        dconf fsyncs per change-set; nine individual sets mean nine D-Bus
+        round-trips and commits, a delayed apply() means one.
+        """
+        self._delayed = True
+        for settings in self._settings.values():
+            settings.delay()
+        try:
+            yield
+        finally:
+            self._delayed = False
+            for settings in self._settings.values():
+                settings.apply()
+            self.sync()
+
+
+_gio_backend_instance: _GioBackend | None = None
+
+
+def _gio_backend() -> _GioBackend:
+    global _gio_backend_instance
+    if _gio_backend_instance is None:
+        _gio_backend_instance = _GioBackend()
+    return _gio_backend_instance
+
+
+@functools.lru_cache(maxsize=None)
+def _which(name: str) -> str | None:
+    # shutil.which stats every PATH entry; tool availability doesn't change
+    # within a session. invalidate_backend_cache() clears this too.
+    return shutil.which(name)
+
+
+# Installed schemas only change on package updates; this blob's mtime keys
+# the on-disk cache of the CLI availability probe.
+_SCHEMAS_COMPILED = Path("/usr/share/glib-2.0/schemas/gschemas.compiled")
+
+_PROBE_CACHE_FILE: Final[str] = "gsettings_probe.json"
+
+
+def _gsettings_cli_probe() -> bool:
     try:
         out = _run(["gsettings", "list-keys", "org.gnome.system.proxy"], timeout_s=2.0).stdout
     except ProxyApplyError:
@@ -79,6 +200,69 @@ def _gsettings_available() -> bool:
     return "mode" in out
 
 
+def _gsettings_cli_available() -> bool:
+    try:
+        schemas_mtime: float | None = _SCHEMAS_COMPILED.stat().st_mtime
+    except OSError:
+        schemas_mtime = None
+
+    cache_path = get_state_dir() / _PROBE_CACHE_FILE
+    if schemas_mtime is not None:
+        cached = load_json(cache_path, None)
+        if (
+            isinstance(cached, dict)
+            and cached.get("schemas_mtime") == schemas_mtime
+            and cached.get("available")
+        ):
+            return True
+
+    available = _gsettings_cli_probe()
+    # Only a positive answer is durable. A failed probe may just be the
+    # 2s timeout firing under load; persisting it would keep the feature
+    # off until a package update touches the schema blob, so re-probe
+    # negatives on the next launch instead.
+    if available and schemas_mtime is not None:
+        try:
+            save_json(cache_path, {"schemas_mtime": schemas_mtime, "available": True})
+        except OSError:  # pragma: no cover - cache is best-effort
+            logger.info("Could not cache gsettings probe result", exc_info=True)
+    return available
+
+
+def _gsettings_available() -> bool:
+    if Gio is not None:
+        # SettingsSchemaSource.lookup is a hash lookup against the compiled
+        # schema blob; list_schemas() would enumerate every installed schema.
+        source = Gio.SettingsSchemaSource.get_default()
+        return source is not None and source.lookup("org.gnome.system.proxy", True) is not None
+    if _which("gsettings") is None:
+        return False
+    return _gsettings_cli_available()
+
+
+def _dconf_available() -> bool:
+    return _which("dconf") is not None
+
+
+@functools.lru_cache(maxsize=1)
+def _detect_backend() -> ProxyBackendName | None:
+    # Probing costs a subprocess on the CLI path; the answer doesn't change
+    # within a session, so detect once and share across manager instances.
+    if _gsettings_available():
+        return "gsettings"
+    return None
+
+
+def invalidate_backend_cache() -> None:
+    """Forget the detected backend so the next manager probes again."""
+    _detect_backend.cache_clear()
+    _which.cache_clear()
+    try:
+        (get_state_dir() / _PROBE_CACHE_FILE).unlink(missing_ok=True)
+    except OSError:  # pragma: no cover - cache is best-effort
+        logger.info("Could not remove gsettings probe cache", exc_info=True)
+
+
 _GSETTINGS_KEYS: Final[list[tuple[str, str]]] = [
     ("org.gnome.system.proxy", "mode"),
     ("org.gnome.system.proxy", "ignore-hosts"),
@@ -94,10 +278,41 @@ _GSETTINGS_KEYS: Final[list[tuple[str, str]]] = [
 
 
 def _gsettings_get(schema: str, key: str) -> str:
-    return _run(["gsettings", "get", schema, key], timeout_s=2.5).stdout.strip()
+    if Gio is not None:
+        return _gio_backend().get(schema, key)
+    # Reads are tiny ("'none'\n", "false\n"); skip _run's text decoding and
+    # the unused stderr pipe, and decode the few bytes once.
+    cmd = ["gsettings", "get", schema, key]
+    try:
+        result = subprocess.run(
+            cmd,
+            check=False,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            timeout=2.5,
+        )
+    except subprocess.TimeoutExpired as exc:
+        raise ProxyApplyError(
+            f"Command timed out: {cmd}",
+            user_message="Timed out while reading system proxy settings.",
+        ) from exc
+    except OSError as exc:
+        raise ProxyApplyError(
+            f"Command failed: {cmd}: {exc}",
+            user_message="Failed to read system proxy settings (missing tools/permissions).",
+        ) from exc
+    if result.returncode != 0:
+        raise ProxyApplyError(
+            f"Command failed: {cmd}: exit code {result.returncode}",
+            user_message="Failed to read system proxy settings.",
+        )
+    return (result.stdout or b"").strip().decode("utf-8", "replace")
 
 
 def _gsettings_set(schema: str, key: str, value: str) -> None:
+    if Gio is not None:
+        _gio_backend().set(schema, key, value)
+        return
     _run(["gsettings", "set", schema, key, value], timeout_s=2.5)
 
 
@@ -107,81 +322,175 @@ def _format_gsettings_str(value: str) -> str:
     return f"'{value}'"
 
 
-def _format_gsettings_str_list(values: list[str]) -> str:
+@functools.lru_cache(maxsize=32)
+def _format_gsettings_str_list(values: tuple[str, ...]) -> str:
+    # The merged bypass list rarely changes between applies; keyed on the
+    # tuple, repeat applies reuse the rendered literal.
     quoted = ", ".join(_format_gsettings_str(v) for v in values)
     return f"[{quoted}]"
 
 
 def _parse_gsettings_str_list(raw: str) -> list[str]:
+    # gsettings prints string arrays as ['a', 'b'], optionally prefixed with
+    # the @as type annotation when empty. ast.literal_eval ran a full
+    # tokenize+parse per read; hand-rolled splitting covers the same forms
+    # (host names contain no commas) at a fraction of the cost.
     raw = (raw or "").strip()
-    if not raw:
+    if raw.startswith("@as"):
+        raw = raw[3:].strip()
+    if not (raw.startswith("[") and raw.endswith("]")):
         return []
-    try:
-        parsed = ast.literal_eval(raw)
-    except Exception:
-        return []
-    if not isinstance(parsed, list):
+    inner = raw[1:-1].strip()
+    if not inner:
         return []
     out: list[str] = []
-    for item in parsed:
-        if isinstance(item, str) and item.strip():
-            out.append(item.strip())
+    for item in inner.split(","):
+        item = item.strip()
+        if len(item) >= 2 and item[0] == item[-1] and item[0] in "'\"":
+            item = item[1:-1].replace("\\'", "'").replace('\\"', '"')
+            item = item.strip()
+        if item:
+            out.append(item)
     return out
 
 
+def _gsettings_dump_recursive(root: str = "org.gnome.system.proxy") -> dict[str, str]:
+    """Dump every key under `root` (and child schemas) in a single spawn.
+
+    `gsettings list-recursively` prints `schema key value` per line, so one
+    fork+exec replaces the ten sequential `gsettings get` calls a snapshot
+    would otherwise cost.
+    """
+    out = _run(["gsettings", "list-recursively", root], timeout_s=2.5).stdout
+    dump: dict[str, str] = {}
+    for line in out.splitlines():
+        parts = line.split(None, 2)
+        if len(parts) != 3:
+            continue
+        schema, key, value = parts
+        dump[f"{schema}:{key}"] = value.strip()
+    return dump
+
+
 def _gsettings_snapshot() -> dict[str, str]:
+    if Gio is None:
+        try:
+            dump = _gsettings_dump_recursive()
+        except ProxyApplyError:
+            dump = {}
+        if all(f"{schema}:{key}" in dump for schema, key in _GSETTINGS_KEYS):
+            return {f"{schema}:{key}": dump[f"{schema}:{key}"] for schema, key in _GSETTINGS_KEYS}
+        # Older gsettings without list-recursively (or a partial dump): the
+        # per-key reads are independent subprocesses, so overlap them.
+        with ThreadPoolExecutor(max_workers=len(_GSETTINGS_KEYS)) as executor:
+            values = executor.map(lambda pair: _gsettings_get(*pair), _GSETTINGS_KEYS)
+            return {
+                f"{schema}:{key}": value
+                for (schema, key), value in zip(_GSETTINGS_KEYS, values)
+            }
+    # Gio reads are in-process hash lookups; a pool would only add overhead.
     snap: dict[str, str] = {}
     for schema, key in _GSETTINGS_KEYS:
         snap[f"{schema}:{key}"] = _gsettings_get(schema, key)
     return snap
 
 
+def _gsettings_write_batch():
+    """Coalesce a run of _gsettings_set calls into one commit where possible."""
+    if Gio is not None:
+        return _gio_backend().batch()
+    return contextlib.nullcontext()
+
+
 def _gsettings_restore(snapshot: dict[str, str]) -> None:
     # Restore non-mode keys first, then mode last to avoid transient broken proxy states.
     mode_value = snapshot.get("org.gnome.system.proxy:mode")
-    for schema, key in _GSETTINGS_KEYS:
-        if schema == "org.gnome.system.proxy" and key == "mode":
-            continue
-        raw_value = snapshot.get(f"{schema}:{key}")
-        if raw_value is None:
-            continue
-        _gsettings_set(schema, key, raw_value)
-    if mode_value is not None:
-        _gsettings_set("org.gnome.system.proxy", "mode", mode_value)
+    with _gsettings_write_batch():
+        for schema, key in _GSETTINGS_KEYS:
+            if schema == "org.gnome.system.proxy" and key == "mode":
+                continue
+            raw_value = snapshot.get(f"{schema}:{key}")
+            if raw_value is None:
+                continue
+            _gsettings_set(schema, key, raw_value)
+        if mode_value is not None:
+            _gsettings_set("org.gnome.system.proxy", "mode", mode_value)
 
 
 def _gsettings_apply(cfg: SystemProxyConfig) -> None:
-    # Merge bypass list with existing ignore-hosts.
+    # Merge bypass list with existing ignore-hosts. dict.fromkeys keeps
+    # insertion order and dedups in O(1) per item, unlike the linear
+    # `item not in merged` scan it replaces.
     existing = _parse_gsettings_str_list(_gsettings_get("org.gnome.system.proxy", "ignore-hosts"))
-    merged: list[str] = []
-    for item in existing + list(cfg.bypass_hosts or []):
-        item = (item or "").strip()
-        if not item:
-            continue
-        if item not in merged:
-            merged.append(item)
+    merged = tuple(
+        dict.fromkeys(
+            stripped
+            for item in itertools.chain(existing, cfg.bypass_hosts or ())
+            if (stripped := (item or "").strip())
+        )
+    )
+
+    if Gio is None and _dconf_available():
+        # `dconf load` applies a whole key-file in one transaction and one
+        # spawn instead of nine sequential gsettings processes. Atomicity
+        # also removes the mode-last ordering concern below.
+        keyfile = "\n".join(
+            [
+                "[/]",
+                "mode='manual'",
+                "use-same-proxy=true",
+                f"ignore-hosts={_format_gsettings_str_list(merged)}",
+                "",
+                "[http]",
+                "enabled=true",
+                f"host={_format_gsettings_str(cfg.http_host)}",
+                f"port={int(cfg.http_port)}",
+                "",
+                "[https]",
+                f"host={_format_gsettings_str(cfg.http_host)}",
+                f"port={int(cfg.http_port)}",
+                "",
+                "[socks]",
+                f"host={_format_gsettings_str(cfg.socks_host)}",
+                f"port={int(cfg.socks_port)}",
+                "",
+            ]
+        )
+        _run(["dconf", "load", "/system/proxy/"], input_text=keyfile)
+        return
 
     # Set per-protocol first, then switch mode to manual last.
-    _gsettings_set("org.gnome.system.proxy.http", "enabled", "true")
-    _gsettings_set("org.gnome.system.proxy.http", "host", _format_gsettings_str(cfg.http_host))
-    _gsettings_set("org.gnome.system.proxy.http", "port", str(int(cfg.http_port)))
-    _gsettings_set("org.gnome.system.proxy.https", "host", _format_gsettings_str(cfg.http_host))
-    _gsettings_set("org.gnome.system.proxy.https", "port", str(int(cfg.http_port)))
-    _gsettings_set("org.gnome.system.proxy.socks", "host", _format_gsettings_str(cfg.socks_host))
-    _gsettings_set("org.gnome.system.proxy.socks", "port", str(int(cfg.socks_port)))
-    _gsettings_set("org.gnome.system.proxy", "use-same-proxy", "true")
-    _gsettings_set("org.gnome.system.proxy", "ignore-hosts", _format_gsettings_str_list(merged))
-    _gsettings_set("org.gnome.system.proxy", "mode", "'manual'")
+    with _gsettings_write_batch():
+        for schema, key, value in _render_gsettings_commands(cfg):
+            _gsettings_set(schema, key, value)
+        _gsettings_set("org.gnome.system.proxy", "ignore-hosts", _format_gsettings_str_list(merged))
+        _gsettings_set("org.gnome.system.proxy", "mode", "'manual'")
+
+
+@functools.lru_cache(maxsize=32)
+def _render_gsettings_commands(cfg: SystemProxyConfig) -> tuple[tuple[str, str, str], ...]:
+    """Render the config-derived (schema, key, value) writes once per config.
+
+    Reconnects re-apply the same config, so the formatting work is paid on
+    first use only. ignore-hosts (merged with the user's current list at
+    apply time) and mode (which must land last) stay dynamic in the caller.
+    """
+    return (
+        ("org.gnome.system.proxy.http", "enabled", "true"),
+        ("org.gnome.system.proxy.http", "host", _format_gsettings_str(cfg.http_host)),
+        ("org.gnome.system.proxy.http", "port", str(int(cfg.http_port))),
+        ("org.gnome.system.proxy.https", "host", _format_gsettings_str(cfg.http_host)),
+        ("org.gnome.system.proxy.https", "port", str(int(cfg.http_port))),
+        ("org.gnome.system.proxy.socks", "host", _format_gsettings_str(cfg.socks_host)),
+        ("org.gnome.system.proxy.socks", "port", str(int(cfg.socks_port))),
+        ("org.gnome.system.proxy", "use-same-proxy", "true"),
+    )
 
 
 class SystemProxyManager:
     def __init__(self, *, state_dir: Path | None = None) -> None:
         self._state_dir = state_dir or get_state_dir()
-
-        backend: ProxyBackendName | None = None
-        if _gsettings_available():
-            backend = "gsettings"
-        self._backend = backend
+        self._backend = _detect_backend()
 
     @property
     def backend(self) -> ProxyBackendName | None:
@@ -206,6 +515,10 @@ class SystemProxyManager:
         return True
 
     def apply(self, cfg: SystemProxyConfig) -> None:
+        if not isinstance(cfg.bypass_hosts, tuple):
+            # NamedTuple doesn't enforce field types; lru_cache keys need the
+            # whole config hashable.
+            cfg = cfg._replace(bypass_hosts=tuple(cfg.bypass_hosts or ()))
         if self._backend != "gsettings":
             raise ProxyApplyError(
                 f"Unsupported system proxy backend: {self._backend}",
@@ -222,7 +535,11 @@ class SystemProxyManager:
                 pass
 
         snapshot = _gsettings_snapshot()
-        save_json(self.snapshot_path, {"backend": "gsettings", "snapshot": snapshot})
+        payload = {"backend": "gsettings", "snapshot": snapshot}
+        # Re-applying with unchanged settings (e.g. after a failed restore
+        # above) would rewrite an identical file; skip the fsync in that case.
+        if load_json(self.snapshot_path, None) != payload:
+            save_json(self.snapshot_path, payload)
 
         try:
             _gsettings_apply(cfg)
@@ -252,7 +569,7 @@ class SystemProxyManager:
 
         _gsettings_restore({str(k): str(v) for k, v in snapshot.items()})
         try:
-            self.snapshot_path.unlink()
+            self.snapshot_path.unlink(missing_ok=True)
         except OSError:
             logger.exception("Failed to remove system proxy snapshot: %s", self.snapshot_path)
 
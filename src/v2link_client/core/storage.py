@@ -3,11 +3,18 @@
 from __future__ import annotations
 
 import json
+import os
 from pathlib import Path
+import tempfile
 from typing import Any
 
 from platformdirs import user_config_path, user_data_path, user_state_path
 
+try:  # Optional speedup; the app stays dependency-free without it.
+    import orjson
+except ImportError:  # pragma: no cover - depends on environment
+    orjson = None  # type: ignore[assignment]
+
 APP_NAME = "v2link-client"
 
 
@@ -33,16 +40,40 @@ def ensure_dirs() -> None:
 
 
 def load_json(path: Path, default: Any) -> Any:
-    if not path.exists():
+    # Read first and handle the miss, rather than exists()-then-read: the
+    # common case pays one syscall instead of two, and there's no window for
+    # the file to vanish between the check and the open.
+    try:
+        raw = path.read_bytes()
+    except FileNotFoundError:
         return default
     try:
-        with path.open("r", encoding="utf-8") as handle:
-            return json.load(handle)
-    except json.JSONDecodeError:
+        if orjson is not None:
+            return orjson.loads(raw)
+        return json.loads(raw)
+    except ValueError:  # covers json and orjson decode errors
         return default
 
 
 def save_json(path: Path, data: Any) -> None:
+    # Write-to-temp + rename so a crash mid-write can't leave a truncated
+    # file behind; the system proxy snapshot in particular must survive
+    # crashes intact or the user's settings can't be restored.
     path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", encoding="utf-8") as handle:
-        json.dump(data, handle, indent=2, sort_keys=True)
+    if orjson is not None:
+        payload = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS)
+    else:
+        payload = json.dumps(data, indent=2, sort_keys=True).encode("utf-8")
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as handle:
+            handle.write(payload)
+            handle.flush()
+            os.fsync(handle.fileno())
+        os.replace(tmp_name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
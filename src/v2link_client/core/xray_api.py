@@ -8,17 +8,13 @@ their setup manually.
 from __future__ import annotations
 
 from dataclasses import dataclass
+import functools
 import json
-import re
 import subprocess
-from typing import Final
 
 from v2link_client.core.errors import AppError, BinaryMissingError
 
 
-_STAT_RE: Final[re.Pattern[str]] = re.compile(r'name:\\s*\"(?P<name>[^\"]+)\"\\s+value:\\s*(?P<value>\\d+)')
-
-
 class XrayApiError(AppError):
     pass
 
@@ -52,11 +48,12 @@ def statsquery(
         cmd += ["-reset"]
 
     try:
+        # Bytes mode: json.loads accepts bytes directly, so decoding all of
+        # stdout to str first would just add a UTF-8 pass per poll.
         result = subprocess.run(
             cmd,
             check=False,
             capture_output=True,
-            text=True,
             timeout=timeout_s + 1.0,
         )
     except FileNotFoundError as exc:
@@ -70,19 +67,24 @@ def statsquery(
             user_message="Xray API timed out while fetching stats.",
         ) from exc
 
+    raw_bytes = (result.stdout or b"").strip()
+
     if result.returncode != 0:
-        detail = (result.stderr or "").strip() or (result.stdout or "").strip() or "unknown error"
+        detail = (
+            (result.stderr or b"").decode("utf-8", "replace").strip()
+            or raw_bytes.decode("utf-8", "replace").strip()
+            or "unknown error"
+        )
         raise XrayApiError(
             f"xray api statsquery failed: {detail}",
             user_message=f"Xray API stats query failed: {detail}",
         )
 
     # Newer Xray prints JSON, older versions may print text.
-    raw_out = (result.stdout or "").strip()
-    if raw_out:
+    if raw_bytes:
         try:
-            payload = json.loads(raw_out)
-        except json.JSONDecodeError:
+            payload = json.loads(raw_bytes)
+        except (json.JSONDecodeError, UnicodeDecodeError):
             payload = None
         if isinstance(payload, dict):
             stats: dict[str, int] = {}
@@ -101,21 +103,40 @@ def statsquery(
                         stats[name] = 0
             return stats
 
-    stats: dict[str, int] = {}
-    for line in raw_out.splitlines():
-        match = _STAT_RE.search(line)
-        if not match:
-            continue
-        name = match.group("name")
-        try:
-            value = int(match.group("value"))
-        except ValueError:
-            continue
-        stats[name] = value
+    return _parse_stats_text(raw_bytes.decode("utf-8", "replace"))
 
+
+def _parse_stats_text(text: str) -> dict[str, int]:
+    """Parse the prototext form older Xray builds print.
+
+    Entries look like `name: "..."` followed by `value: N` (same or next
+    line). Simple substring/partition parsing beats regex here and, unlike
+    the previous pattern, copes with name and value on separate lines.
+    """
+    stats: dict[str, int] = {}
+    name: str | None = None
+    for line in text.splitlines():
+        if "name:" in line:
+            _, opening, rest = line.partition('"')
+            candidate, closing, _ = rest.partition('"')
+            name = candidate if opening and closing else None
+        if name is not None and "value:" in line:
+            try:
+                stats[name] = int(line.rsplit(":", 1)[1].strip())
+            except ValueError:
+                continue
+            name = None
     return stats
 
 
+@functools.lru_cache(maxsize=8)
+def _traffic_keys(outbound_tag: str) -> tuple[str, str, str]:
+    # The stats poller runs every second while the core is up; build the
+    # pattern and both stat keys once per tag instead of per call.
+    prefix = f"outbound>>>{outbound_tag}>>>traffic>>>"
+    return prefix, f"{prefix}uplink", f"{prefix}downlink"
+
+
 def get_outbound_traffic(
     xray_path: str,
     *,
@@ -123,8 +144,6 @@ def get_outbound_traffic(
     outbound_tag: str = "proxy",
     timeout_s: float = 3.0,
 ) -> TrafficStats:
-    pattern = f"outbound>>>{outbound_tag}>>>traffic>>>"
+    pattern, up_key, down_key = _traffic_keys(outbound_tag)
     stats = statsquery(xray_path, server=server, pattern=pattern, timeout_s=timeout_s)
-    up = stats.get(f"outbound>>>{outbound_tag}>>>traffic>>>uplink", 0)
-    down = stats.get(f"outbound>>>{outbound_tag}>>>traffic>>>downlink", 0)
-    return TrafficStats(uplink_bytes=up, downlink_bytes=down)
+    return TrafficStats(uplink_bytes=stats.get(up_key, 0), downlink_bytes=stats.get(down_key, 0))
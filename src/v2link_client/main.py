@@ -4,16 +4,21 @@ from __future__ import annotations
 
 import sys
 
-from PyQt6.QtWidgets import QApplication
-
 from v2link_client.core.logging_setup import setup_logging
 from v2link_client.core.storage import ensure_dirs
-from v2link_client.ui.main_window import MainWindow
 
 
 def main() -> int:
     ensure_dirs()
     setup_logging()
+
+    # Import Qt only once we're actually launching the GUI; it dominates
+    # import time and `python -m v2link_client --help`-style invocations
+    # shouldn't pay for it.
+    from PyQt6.QtWidgets import QApplication
+
+    from v2link_client.ui.main_window import MainWindow
+
     app = QApplication(sys.argv)
     app.setApplicationName("v2link-client")
 
@@ -3,9 +3,10 @@
 from __future__ import annotations
 
 import logging
+import os
 import time
 
-from PyQt6.QtCore import QObject, QRunnable, Qt, QThreadPool, QTimer, pyqtSignal
+from PyQt6.QtCore import QObject, QRunnable, QSocketNotifier, Qt, QThreadPool, QTimer, pyqtSignal
 from PyQt6.QtGui import QAction
 from PyQt6.QtWidgets import (
     QApplication,
@@ -28,18 +29,25 @@ from v2link_client.core.config_builder import (
     DEFAULT_LISTEN,
     DEFAULT_SOCKS_PORT,
     build_xray_config,
+    dump_xray_config,
 )
 from v2link_client.core.errors import AppError
 from v2link_client.core.health_check import ProxyHealthResult, check_http_proxy
 from v2link_client.core.humanize import format_bytes, format_duration_s, format_mbps
 from v2link_client.core.link_parser import parse_link
 from v2link_client.core.net_probe import ServerPingResult, ping_server
-from v2link_client.core.proxy_manager import SystemProxyConfig, SystemProxyManager
+from v2link_client.core.proxy_manager import (
+    DEFAULT_BYPASS,
+    SystemProxyConfig,
+    SystemProxyManager,
+)
 from v2link_client.core.process_manager import (
     XrayProcessManager,
     ensure_port_available,
     find_free_port,
     find_xray_binary,
+    release_ports,
+    reserve_ports,
     validate_xray_config,
 )
 from v2link_client.core.speed_test import SpeedTestResult, run_speed_test_via_http_proxy
@@ -55,6 +63,11 @@ XRAY_CONFIG_FILE = "xray_config.json"
 
 HEALTH_INTERVAL_MS = 5000
 
+# Adaptive traffic polling: 1 s while bytes are moving, doubling to 10 s when
+# idle. Each poll spawns an `xray api` process, so idle sessions matter.
+STATS_POLL_MIN_S = 1.0
+STATS_POLL_MAX_S = 10.0
+
 
 class HealthCheckWorkerSignals(QObject):
     result = pyqtSignal(object)
@@ -166,7 +179,11 @@ class MainWindow(QMainWindow):
         metrics_row.addWidget(self.speed_label, 1)
         metrics_row.addWidget(self.traffic_label)
 
-        self.diagnostics_widget = DiagnosticsWidget()
+        # The diagnostics pane is the heaviest widget here; building it one
+        # event-loop tick later (see _install_diagnostics) lets the window
+        # paint first. Until then an empty placeholder keeps the layout slot.
+        self._diagnostics_placeholder: QWidget | None = QWidget()
+        self.diagnostics_widget: DiagnosticsWidget | None = None
 
         layout = QVBoxLayout()
         layout.setContentsMargins(16, 16, 16, 16)
@@ -174,9 +191,10 @@ class MainWindow(QMainWindow):
         layout.addLayout(top_row)
         layout.addLayout(control_row)
         layout.addLayout(metrics_row)
-        layout.addWidget(self.diagnostics_widget, 1)
+        layout.addWidget(self._diagnostics_placeholder, 1)
 
         central.setLayout(layout)
+        self._layout = layout
 
         self._process = XrayProcessManager()
         self._validated_config_path = None
@@ -184,13 +202,13 @@ class MainWindow(QMainWindow):
         self._socks_port = DEFAULT_SOCKS_PORT
         self._http_port = DEFAULT_HTTP_PORT
         self._api_port: int | None = None
-        self.diagnostics_widget.set_proxy_ports(
-            socks_port=self._socks_port, http_port=self._http_port
-        )
         self._thread_pool = QThreadPool.globalInstance()
+        QTimer.singleShot(0, self._install_diagnostics)
 
         self._system_proxy = SystemProxyManager()
         self._system_proxy_applied = False
+        self._system_proxy_apply_in_flight = False
+        self._system_proxy_restore_pending = False
         if not self._system_proxy.is_supported():
             self.system_proxy_checkbox.setEnabled(False)
             self.system_proxy_checkbox.setToolTip(
@@ -209,13 +227,18 @@ class MainWindow(QMainWindow):
         self._status_timer.timeout.connect(self._poll_core_status)
 
         self._core_started_at: float | None = None
+        self._pidfd: int | None = None
+        self._pidfd_notifier: QSocketNotifier | None = None
         self._stats_in_flight = False
         self._stats_token = 0
         self._last_stats_at: float | None = None
         self._last_uplink: int | None = None
         self._last_downlink: int | None = None
+        self._stats_poll_interval_s = STATS_POLL_MIN_S
+        self._last_stats_kick_at: float | None = None
         self._ping_in_flight = False
         self._speed_test_in_flight = False
+        self._validate_in_flight = False
 
         self._load_profile()
         self._apply_theme(self._theme, persist=False)
@@ -228,6 +251,23 @@ class MainWindow(QMainWindow):
         except Exception:
             logger.exception("Failed to restore system proxy from previous session")
 
+    def _install_diagnostics(self) -> None:
+        # Runs on the first event-loop tick, before any user interaction can
+        # reach the slots that talk to the widget.
+        if self.diagnostics_widget is not None:
+            return
+        widget = DiagnosticsWidget()
+        widget.set_proxy_ports(socks_port=self._socks_port, http_port=self._http_port)
+        placeholder = self._diagnostics_placeholder
+        self._diagnostics_placeholder = None
+        if placeholder is not None:
+            self._layout.removeWidget(placeholder)
+            placeholder.deleteLater()
+        # The placeholder was the last layout item, so appending keeps the
+        # slot (and its stretch factor).
+        self._layout.addWidget(widget, 1)
+        self.diagnostics_widget = widget
+
     def _setup_menu(self) -> None:
         help_menu = self.menuBar().addMenu("&Help")
         about_action = QAction("About", self)
@@ -245,6 +285,8 @@ class MainWindow(QMainWindow):
         QMessageBox.about(self, "About v2link-client", text)
 
     def _on_validate_clicked(self) -> None:
+        if self._validate_in_flight:
+            return
         self.status_label.setText("STOPPED")
         self._validated_config_path = None
         self._validated_link = None
@@ -258,37 +300,65 @@ class MainWindow(QMainWindow):
         self._last_stats_at = None
         self._last_uplink = None
         self._last_downlink = None
+        self._stats_poll_interval_s = STATS_POLL_MIN_S
+        self._last_stats_kick_at = None
         self._set_metrics_defaults()
 
+        # Read all UI state up front; the worker must not touch widgets.
         raw_link = self.link_input.text()
-        try:
-            parsed_link = parse_link(raw_link)
-            socks_port, http_port, api_port = self._pick_proxy_ports()
-            config = build_xray_config(
-                parsed_link, socks_port=socks_port, http_port=http_port, api_port=api_port
-            )
-            config_path = get_state_dir() / XRAY_CONFIG_FILE
-            save_json(config_path, config)
+        theme = self._theme
+        apply_system_proxy = bool(self.system_proxy_checkbox.isChecked())
 
-            profile_path = get_config_dir() / PROFILE_FILE
-            profile = load_json(profile_path, {})
-            if not isinstance(profile, dict):
-                profile = {}
-            profile["link"] = raw_link
-            profile["theme"] = self._theme
-            profile["apply_system_proxy"] = bool(self.system_proxy_checkbox.isChecked())
-            save_json(profile_path, profile)
-
-            xray = find_xray_binary()
-            validate_xray_config(xray, config_path)
-        except AppError as exc:
-            self.diagnostics_widget.set_hint(exc.user_message)
-            return
-        except Exception as exc:  # pragma: no cover - defensive
-            logger.exception("Validation failed")
-            self.diagnostics_widget.set_hint(f"Validation failed: {exc}")
+        self._validate_in_flight = True
+        self.validate_button.setEnabled(False)
+        self.diagnostics_widget.set_hint("Validating link ...")
+
+        def _run():
+            # Port probing, config write, profile save and the `xray run
+            # -test` subprocess all block; keep them off the UI thread.
+            try:
+                parsed_link = parse_link(raw_link)
+                socks_port, http_port, api_port = self._pick_proxy_ports()
+                config = build_xray_config(
+                    parsed_link, socks_port=socks_port, http_port=http_port, api_port=api_port
+                )
+                config_path = get_state_dir() / XRAY_CONFIG_FILE
+                config_path.parent.mkdir(parents=True, exist_ok=True)
+                config_path.write_bytes(dump_xray_config(config))
+
+                profile_path = get_config_dir() / PROFILE_FILE
+                profile = load_json(profile_path, {})
+                if not isinstance(profile, dict):
+                    profile = {}
+                profile["link"] = raw_link
+                profile["theme"] = theme
+                profile["apply_system_proxy"] = apply_system_proxy
+                save_json(profile_path, profile)
+
+                xray = find_xray_binary()
+                validate_xray_config(xray, config_path)
+            except AppError as exc:
+                return "err", exc.user_message
+            except Exception as exc:  # pragma: no cover - defensive
+                logger.exception("Validation failed")
+                return "err", f"Validation failed: {exc}"
+            return "ok", (parsed_link, config_path, socks_port, http_port, api_port, xray)
+
+        worker = HealthCheckWorker(_run)
+        worker.signals.result.connect(self._on_validate_done)
+        worker.signals.error.connect(self._on_validate_error)
+        self._thread_pool.start(worker)
+
+    def _on_validate_done(self, payload: object) -> None:
+        self._validate_in_flight = False
+        self.validate_button.setEnabled(True)
+
+        status, data = payload  # type: ignore[misc]
+        if status != "ok":
+            self.diagnostics_widget.set_hint(str(data))
             return
 
+        parsed_link, config_path, socks_port, http_port, api_port, xray = data
         self._process = XrayProcessManager(xray)
         self._validated_config_path = config_path
         self._validated_link = parsed_link
@@ -310,6 +380,11 @@ class MainWindow(QMainWindow):
         self.diagnostics_widget.set_hint(hint)
         self._set_health_state("offline", "Not running")
 
+    def _on_validate_error(self, message: str) -> None:
+        self._validate_in_flight = False
+        self.validate_button.setEnabled(True)
+        self.diagnostics_widget.set_hint(f"Validation failed: {message}")
+
     def _on_start_stop_clicked(self) -> None:
         if self._process.is_running():
             self._stop_core(user_message="Stopped.")
@@ -319,11 +394,14 @@ class MainWindow(QMainWindow):
             self.diagnostics_widget.set_hint("Validate & Save a link first.")
             return
 
+        endpoints = [(DEFAULT_LISTEN, self._socks_port), (DEFAULT_LISTEN, self._http_port)]
+        if self._api_port is not None:
+            endpoints.append((DEFAULT_LISTEN, int(self._api_port)))
         try:
-            ensure_port_available(DEFAULT_LISTEN, self._socks_port)
-            ensure_port_available(DEFAULT_LISTEN, self._http_port)
-            if self._api_port is not None:
-                ensure_port_available(DEFAULT_LISTEN, int(self._api_port))
+            # Hold the ports until just before the spawn so nothing can grab
+            # them between the check and Xray's own bind.
+            held = reserve_ports(endpoints)
+            release_ports(held)
             self._process.start(self._validated_config_path)
         except AppError as exc:
             self.diagnostics_widget.set_hint(exc.user_message)
@@ -347,6 +425,8 @@ class MainWindow(QMainWindow):
         self._last_stats_at = None
         self._last_uplink = None
         self._last_downlink = None
+        self._stats_poll_interval_s = STATS_POLL_MIN_S
+        self._last_stats_kick_at = None
         self._health_token += 1
         self._last_health_ok = None
         self._set_health_state("connecting", "Checking…")
@@ -357,8 +437,38 @@ class MainWindow(QMainWindow):
         )
         if self.system_proxy_checkbox.isChecked():
             self._apply_system_proxy()
+        self._watch_core_exit()
         self._status_timer.start()
 
+    def _watch_core_exit(self) -> None:
+        # A pidfd becomes readable when the child exits, so an unexpected
+        # core death flips the UI immediately instead of waiting for the next
+        # status tick (the 1s timer still drives uptime and stats).
+        pid = self._process.pid()
+        if pid is None or not hasattr(os, "pidfd_open"):
+            return
+        try:
+            self._pidfd = os.pidfd_open(pid)
+        except OSError:
+            logger.info("pidfd_open unavailable; falling back to polling", exc_info=True)
+            return
+        self._pidfd_notifier = QSocketNotifier(self._pidfd, QSocketNotifier.Type.Read, self)
+        self._pidfd_notifier.activated.connect(self._on_core_exited)
+
+    def _unwatch_core_exit(self) -> None:
+        if self._pidfd_notifier is not None:
+            self._pidfd_notifier.setEnabled(False)
+            self._pidfd_notifier.deleteLater()
+            self._pidfd_notifier = None
+        if self._pidfd is not None:
+            os.close(self._pidfd)
+            self._pidfd = None
+
+    def _on_core_exited(self) -> None:
+        self._unwatch_core_exit()
+        if not self._process.is_running():
+            self._poll_core_status()
+
     def _poll_core_status(self) -> None:
         if self._process.is_running():
             self._update_uptime()
@@ -366,6 +476,7 @@ class MainWindow(QMainWindow):
             return
 
         code = self._process.returncode()
+        self._unwatch_core_exit()
         self._status_timer.stop()
         self.status_label.setText("STOPPED")
         self.start_stop_button.setText("Start")
@@ -391,6 +502,7 @@ class MainWindow(QMainWindow):
         self.diagnostics_widget.set_hint(hint)
 
     def _stop_core(self, *, user_message: str) -> None:
+        self._unwatch_core_exit()
         self._status_timer.stop()
         self._health_timer.stop()
         self._health_token += 1
@@ -507,6 +619,14 @@ class MainWindow(QMainWindow):
         if not self._process.is_running():
             return
 
+        now = time.monotonic()
+        if (
+            self._last_stats_kick_at is not None
+            and now - self._last_stats_kick_at < self._stats_poll_interval_s
+        ):
+            return
+        self._last_stats_kick_at = now
+
         token = self._stats_token
         api_server = f"{DEFAULT_LISTEN}:{self._api_port}"
         xray_path = self._process.binary.path
@@ -542,6 +662,11 @@ class MainWindow(QMainWindow):
                 f"SPEED (↑ {format_mbps(up_bps)} / ↓ {format_mbps(down_bps)})"
             )
 
+        if (stats.uplink_bytes, stats.downlink_bytes) == (self._last_uplink, self._last_downlink):
+            self._stats_poll_interval_s = min(STATS_POLL_MAX_S, self._stats_poll_interval_s * 2)
+        else:
+            self._stats_poll_interval_s = STATS_POLL_MIN_S
+
         self._last_stats_at = float(now)
         self._last_uplink = int(stats.uplink_bytes)
         self._last_downlink = int(stats.downlink_bytes)
@@ -733,38 +858,69 @@ class MainWindow(QMainWindow):
         super().closeEvent(event)
 
     def _apply_system_proxy(self) -> None:
-        if self._system_proxy_applied:
+        if self._system_proxy_applied or self._system_proxy_apply_in_flight:
             return
         if not self._system_proxy.is_supported():
             self.diagnostics_widget.set_hint(
                 "System proxy apply is not supported on this desktop yet. Use manual proxy settings."
             )
             return
-        try:
-            self._system_proxy.apply(
-                SystemProxyConfig(
-                    http_host=DEFAULT_LISTEN,
-                    http_port=int(self._http_port),
-                    socks_host=DEFAULT_LISTEN,
-                    socks_port=int(self._socks_port),
-                    bypass_hosts=["localhost", "127.0.0.0/8", "::1"],
-                )
-            )
-        except AppError as exc:
-            self.diagnostics_widget.set_hint(f"Started, but failed to apply system proxy: {exc.user_message}")
-            return
-        except Exception as exc:  # pragma: no cover - defensive
-            logger.exception("System proxy apply failed")
-            self.diagnostics_widget.set_hint(f"Started, but failed to apply system proxy: {exc}")
-            return
 
+        cfg = SystemProxyConfig(
+            http_host=DEFAULT_LISTEN,
+            http_port=int(self._http_port),
+            socks_host=DEFAULT_LISTEN,
+            socks_port=int(self._socks_port),
+            bypass_hosts=DEFAULT_BYPASS,
+        )
+        self._system_proxy_apply_in_flight = True
+
+        def _run():
+            # Snapshot + apply shell out to gsettings/dconf on the CLI path;
+            # don't stall the UI thread on those spawns.
+            try:
+                self._system_proxy.apply(cfg)
+            except AppError as exc:
+                return "err", exc.user_message
+            except Exception as exc:  # pragma: no cover - defensive
+                logger.exception("System proxy apply failed")
+                return "err", str(exc)
+            return "ok", None
+
+        worker = HealthCheckWorker(_run)
+        worker.signals.result.connect(self._on_system_proxy_applied)
+        self._thread_pool.start(worker)
+
+    def _on_system_proxy_applied(self, payload: object) -> None:
+        self._system_proxy_apply_in_flight = False
+        status, data = payload  # type: ignore[misc]
+        if status != "ok":
+            # apply() already rolled back whatever it managed to write.
+            self._system_proxy_restore_pending = False
+            self.diagnostics_widget.set_hint(f"Started, but failed to apply system proxy: {data}")
+            return
         self._system_proxy_applied = True
+        if self._system_proxy_restore_pending or not self._process.is_running():
+            # The core died (or a stop raced us) while we were applying;
+            # undo straight away.
+            self._system_proxy_restore_pending = False
+            self._restore_system_proxy()
+            return
         self.diagnostics_widget.set_hint(
             f"System proxy applied. Most apps should now use {DEFAULT_LISTEN}:{self._http_port} automatically."
         )
 
     def _restore_system_proxy(self) -> None:
-        if not self._system_proxy_applied and not self._system_proxy.snapshot_path.exists():
+        if self._system_proxy_apply_in_flight:
+            # The apply worker is mid-flight; restoring now would race its
+            # writes through the same backend. Defer to
+            # _on_system_proxy_applied, which restores once the worker lands.
+            self._system_proxy_restore_pending = True
+            return
+        if (
+            not self._system_proxy_applied
+            and not self._system_proxy.snapshot_path.exists()
+        ):
             return
         try:
             self._system_proxy.restore()
@@ -4,9 +4,19 @@ import types
 
 import pytest
 
+import v2link_client.core.health_check as hc
 from v2link_client.core.health_check import ProxyHealthResult, check_http_proxy
 
 
+@pytest.fixture(autouse=True)
+def _reset_opener_cache():
+    # The opener is cached per proxy endpoint; clear it so each test's
+    # monkeypatched build_opener takes effect.
+    hc._get_opener.cache_clear()
+    yield
+    hc._get_opener.cache_clear()
+
+
 class _FakeResponse:
     def __init__(self, status: int) -> None:
         self.status = status
@@ -22,7 +32,7 @@ class _FakeResponse:
 
 
 def test_health_check_success(monkeypatch) -> None:
-    def fake_build_opener(_handler):
+    def fake_build_opener(*_handlers):
         return types.SimpleNamespace(open=lambda _req, timeout: _FakeResponse(204))
 
     monkeypatch.setattr("urllib.request.build_opener", fake_build_opener)
@@ -49,7 +59,7 @@ def test_health_check_tries_fallback_urls(monkeypatch) -> None:
             raise OSError("boom")
         return _FakeResponse(200)
 
-    def fake_build_opener(_handler):
+    def fake_build_opener(*_handlers):
         return types.SimpleNamespace(open=fake_open)
 
     monkeypatch.setattr("urllib.request.build_opener", fake_build_opener)
@@ -61,11 +71,13 @@ def test_health_check_tries_fallback_urls(monkeypatch) -> None:
         https_urls=("https://t/c",),
     )
     assert result.state == "online"
-    assert calls == ["http://t/a", "http://t/b", "https://t/c"]
+    # URLs within a group are probed concurrently, so only the order of the
+    # groups (http before https) is deterministic.
+    assert sorted(calls) == ["http://t/a", "http://t/b", "https://t/c"]
 
 
 def test_health_check_failure(monkeypatch) -> None:
-    def fake_build_opener(_handler):
+    def fake_build_opener(*_handlers):
         def _open(_req, timeout):
             raise OSError("connection refused")
 
@@ -86,7 +98,7 @@ def test_health_check_degraded_http_ok_https_fail(monkeypatch) -> None:
             raise OSError("tls failed")
         return _FakeResponse(204)
 
-    def fake_build_opener(_handler):
+    def fake_build_opener(*_handlers):
         return types.SimpleNamespace(open=fake_open)
 
     monkeypatch.setattr("urllib.request.build_opener", fake_build_opener)
@@ -3,7 +3,7 @@ from __future__ import annotations
 import pytest
 
 from v2link_client.core.errors import InvalidLinkError, UnsupportedSchemeError
-from v2link_client.core.link_parser import VlessLink, parse_link
+from v2link_client.core.link_parser import VlessLink, parse_link, parse_links
 
 
 def test_parse_vless_basic() -> None:
@@ -25,6 +25,19 @@ def test_parse_vless_basic() -> None:
     assert parsed.name == "UdayaSri"
 
 
+def test_parse_vless_uppercase_scheme_and_path() -> None:
+    # Schemes are case-insensitive and a path segment is ignored, as with
+    # the urlparse-based parser.
+    link = (
+        "VLESS://b345f204-4df1-4d31-8243-dae7845099ad@prime.example.com:443/extra"
+        "?security=tls#name"
+    )
+    parsed = parse_link(link)
+    assert parsed.host == "prime.example.com"
+    assert parsed.port == 443
+    assert parsed.security == "tls"
+
+
 def test_parse_vless_rejects_invalid_uuid() -> None:
     link = "vless://not-a-uuid@prime.example.com:443?security=tls"
     with pytest.raises(InvalidLinkError):
@@ -40,3 +53,10 @@ def test_parse_rejects_unimplemented_scheme() -> None:
     with pytest.raises(UnsupportedSchemeError):
         parse_link("vmess://abcd")
 
+
+def test_parse_links_returns_errors_inline() -> None:
+    good = "vless://b345f204-4df1-4d31-8243-dae7845099ad@prime.example.com:443?security=tls"
+    results = parse_links([good, "vless://not-a-uuid@prime.example.com:443", ""])
+    assert isinstance(results[0], VlessLink)
+    assert isinstance(results[1], InvalidLinkError)
+    assert isinstance(results[2], InvalidLinkError)
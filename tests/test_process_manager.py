@@ -5,10 +5,13 @@ import socket
 
 import pytest
 
+import v2link_client.core.process_manager as pm
 from v2link_client.core.errors import PortInUseError
 from v2link_client.core.process_manager import (
     ensure_port_available,
     find_xray_binary,
+    release_ports,
+    reserve_ports,
     validate_xray_config,
 )
 from v2link_client.core.storage import save_json
@@ -23,6 +26,57 @@ def test_ensure_port_available_detects_in_use_port() -> None:
             ensure_port_available(host, port)
 
 
+def test_find_xray_binary_is_cached(monkeypatch) -> None:
+    calls: list[str] = []
+
+    def fake_which(name: str) -> str:
+        calls.append(name)
+        return "/usr/local/bin/xray"
+
+    monkeypatch.setattr(pm.shutil, "which", fake_which)
+    find_xray_binary.cache_clear()
+    try:
+        first = find_xray_binary()
+        second = find_xray_binary()
+    finally:
+        find_xray_binary.cache_clear()
+
+    assert first is second
+    assert calls == ["xray"]
+
+
+def test_reserve_ports_holds_and_releases() -> None:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as probe:
+        probe.bind(("127.0.0.1", 0))
+        _, free_port = probe.getsockname()
+
+    held = reserve_ports([("127.0.0.1", free_port)])
+    try:
+        assert len(held) == 1
+        with pytest.raises(PortInUseError):
+            reserve_ports([("127.0.0.1", free_port)])
+    finally:
+        release_ports(held)
+
+
+def test_reserve_ports_releases_on_partial_failure() -> None:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as blocker:
+        blocker.bind(("127.0.0.1", 0))
+        blocker.listen(1)
+        _, busy_port = blocker.getsockname()
+
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as probe:
+            probe.bind(("127.0.0.1", 0))
+            _, free_port = probe.getsockname()
+
+        with pytest.raises(PortInUseError):
+            reserve_ports([("127.0.0.1", free_port), ("127.0.0.1", busy_port)])
+
+        # The first port must have been released again.
+        held = reserve_ports([("127.0.0.1", free_port)])
+        release_ports(held)
+
+
 def test_validate_xray_config_smoke(tmp_path) -> None:
     if not shutil.which("xray"):
         pytest.skip("xray not installed")
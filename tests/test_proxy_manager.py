@@ -10,6 +10,23 @@ from v2link_client.core.errors import ProxyApplyError
 from v2link_client.core.proxy_manager import SystemProxyConfig, SystemProxyManager
 
 
+@pytest.fixture(autouse=True)
+def _reset_backend_cache(tmp_path, monkeypatch):
+    # Backend detection and which() lookups are cached process-wide; each
+    # test monkeypatches shutil.which differently, so start every test with
+    # a fresh probe. Pointing the compiled-schemas blob at a missing path
+    # also disables the on-disk probe cache. Force the CLI path: with
+    # PyGObject installed the Gio fast path would bypass the faked
+    # shutil.which/subprocess.run and write into the real session dconf.
+    monkeypatch.setattr(pm, "Gio", None)
+    monkeypatch.setattr(pm, "GLib", None)
+    monkeypatch.setattr(pm, "_gio_backend_instance", None)
+    monkeypatch.setattr(pm, "_SCHEMAS_COMPILED", tmp_path / "gschemas.compiled")
+    pm.invalidate_backend_cache()
+    yield
+    pm.invalidate_backend_cache()
+
+
 def test_system_proxy_apply_unsupported_backend(tmp_path, monkeypatch) -> None:
     monkeypatch.setattr(pm.shutil, "which", lambda _name: None)
     mgr = SystemProxyManager(state_dir=tmp_path)
@@ -20,7 +37,7 @@ def test_system_proxy_apply_unsupported_backend(tmp_path, monkeypatch) -> None:
                 http_port=8080,
                 socks_host="127.0.0.1",
                 socks_port=1080,
-                bypass_hosts=["localhost"],
+                bypass_hosts=("localhost",),
             )
         )
 
@@ -28,35 +45,61 @@ def test_system_proxy_apply_unsupported_backend(tmp_path, monkeypatch) -> None:
 def test_system_proxy_apply_and_restore_gsettings(tmp_path, monkeypatch) -> None:
     calls: list[list[str]] = []
 
-    def fake_run(cmd, check, capture_output, text, timeout):  # noqa: ANN001
+    dump = "\n".join(
+        [
+            "org.gnome.system.proxy mode 'none'",
+            "org.gnome.system.proxy ignore-hosts ['localhost']",
+            "org.gnome.system.proxy use-same-proxy false",
+            "org.gnome.system.proxy.http enabled false",
+            "org.gnome.system.proxy.http host ''",
+            "org.gnome.system.proxy.http port 0",
+            "org.gnome.system.proxy.https host ''",
+            "org.gnome.system.proxy.https port 0",
+            "org.gnome.system.proxy.socks host ''",
+            "org.gnome.system.proxy.socks port 0",
+        ]
+    )
+
+    # _gsettings_get runs in binary mode, so get stdout is bytes.
+    get_table: dict[tuple[str, str], bytes] = {
+        ("org.gnome.system.proxy", "mode"): b"'none'\n",
+        ("org.gnome.system.proxy", "ignore-hosts"): b"['localhost']\n",
+        ("org.gnome.system.proxy", "use-same-proxy"): b"false\n",
+        ("org.gnome.system.proxy.http", "enabled"): b"false\n",
+        ("org.gnome.system.proxy.http", "host"): b"''\n",
+        ("org.gnome.system.proxy.http", "port"): b"0\n",
+        ("org.gnome.system.proxy.https", "host"): b"''\n",
+        ("org.gnome.system.proxy.https", "port"): b"0\n",
+        ("org.gnome.system.proxy.socks", "host"): b"''\n",
+        ("org.gnome.system.proxy.socks", "port"): b"0\n",
+    }
+
+    handlers = {
+        ("gsettings", "list-keys"): lambda cmd: subprocess.CompletedProcess(
+            cmd, 0, stdout="mode\nignore-hosts\n", stderr=""
+        ),
+        ("gsettings", "list-recursively"): lambda cmd: subprocess.CompletedProcess(
+            cmd, 0, stdout=dump + "\n", stderr=""
+        ),
+        ("gsettings", "get"): lambda cmd: subprocess.CompletedProcess(
+            cmd, 0, stdout=get_table.get((cmd[2], cmd[3]), b"''\n"), stderr=b""
+        ),
+        ("gsettings", "set"): lambda cmd: subprocess.CompletedProcess(
+            cmd, 0, stdout="", stderr=""
+        ),
+    }
+
+    def fake_run(cmd, **kwargs):  # noqa: ANN001
         calls.append(list(cmd))
+        handler = handlers.get(tuple(cmd[:2]))
+        if handler is None:
+            raise AssertionError(f"Unexpected command: {cmd}")
+        return handler(cmd)
 
-        if cmd[:3] == ["gsettings", "list-keys", "org.gnome.system.proxy"]:
-            return subprocess.CompletedProcess(cmd, 0, stdout="mode\nignore-hosts\n", stderr="")
-
-        if cmd[:2] == ["gsettings", "get"]:
-            schema = cmd[2]
-            key = cmd[3]
-            if (schema, key) == ("org.gnome.system.proxy", "mode"):
-                return subprocess.CompletedProcess(cmd, 0, stdout="'none'\n", stderr="")
-            if (schema, key) == ("org.gnome.system.proxy", "ignore-hosts"):
-                return subprocess.CompletedProcess(cmd, 0, stdout="['localhost']\n", stderr="")
-            if (schema, key) == ("org.gnome.system.proxy", "use-same-proxy"):
-                return subprocess.CompletedProcess(cmd, 0, stdout="false\n", stderr="")
-            if key == "enabled":
-                return subprocess.CompletedProcess(cmd, 0, stdout="false\n", stderr="")
-            if key == "host":
-                return subprocess.CompletedProcess(cmd, 0, stdout="''\n", stderr="")
-            if key == "port":
-                return subprocess.CompletedProcess(cmd, 0, stdout="0\n", stderr="")
-            return subprocess.CompletedProcess(cmd, 0, stdout="''\n", stderr="")
-
-        if cmd[:2] == ["gsettings", "set"]:
-            return subprocess.CompletedProcess(cmd, 0, stdout="", stderr="")
-
-        raise AssertionError(f"Unexpected command: {cmd}")
-
-    monkeypatch.setattr(pm.shutil, "which", lambda _name: "/usr/bin/gsettings")
+    # No dconf: keep the test on the per-key gsettings path.
+    monkeypatch.setattr(
+        pm.shutil, "which", lambda name: "/usr/bin/gsettings" if name == "gsettings" else None
+    )
     monkeypatch.setattr(pm.subprocess, "run", fake_run)
 
     mgr = SystemProxyManager(state_dir=tmp_path)
@@ -66,7 +109,7 @@ def test_system_proxy_apply_and_restore_gsettings(tmp_path, monkeypatch) -> None
             http_port=8080,
             socks_host="127.0.0.1",
             socks_port=1080,
-            bypass_hosts=["localhost", "127.0.0.0/8", "::1"],
+            bypass_hosts=("localhost", "127.0.0.0/8", "::1"),
         )
     )
 
@@ -92,3 +135,126 @@ def test_system_proxy_apply_and_restore_gsettings(tmp_path, monkeypatch) -> None
     set_cmds = [c for c in calls if c[:2] == ["gsettings", "set"]]
     assert ["gsettings", "set", "org.gnome.system.proxy", "mode", "'none'"] in set_cmds
 
+
+class _FakeVariant:
+    def __init__(self, text: str) -> None:
+        self.text = text
+
+    def print_(self, _type_annotate: bool) -> str:
+        return self.text
+
+    def get_type(self) -> str:
+        return "fake-type"
+
+
+class _FakeSchemaInfo:
+    def has_key(self, _key: str) -> bool:  # noqa: A003 - Gio API name
+        return True
+
+
+class _FakeProps:
+    settings_schema = _FakeSchemaInfo()
+
+
+class _FakeSettings:
+    props = _FakeProps()
+
+    def __init__(self, store: dict[tuple[str, str], str], schema: str) -> None:
+        self._store = store
+        self._schema = schema
+
+    def delay(self) -> None:
+        pass
+
+    def apply(self) -> None:
+        pass
+
+    def get_value(self, key: str) -> _FakeVariant:
+        return _FakeVariant(self._store[(self._schema, key)])
+
+    def set_value(self, key: str, variant: _FakeVariant) -> bool:
+        self._store[(self._schema, key)] = variant.text
+        return True
+
+
+def _make_fake_gio(store: dict[tuple[str, str], str]):
+    class _FakeSettingsClass:
+        @staticmethod
+        def new(schema: str) -> _FakeSettings:
+            return _FakeSettings(store, schema)
+
+        @staticmethod
+        def sync() -> None:
+            pass
+
+    class _FakeSchemaSource:
+        @staticmethod
+        def get_default() -> "_FakeSchemaSource":
+            return _FakeSchemaSource()
+
+        def lookup(self, _schema: str, _recursive: bool) -> object:
+            return object()
+
+    class _FakeGio:
+        Settings = _FakeSettingsClass
+        SettingsSchemaSource = _FakeSchemaSource
+
+    class _FakeGLib:
+        class Variant:
+            @staticmethod
+            def parse(
+                _expected_type: object, text: str, _format: object, _limits: object
+            ) -> _FakeVariant:
+                return _FakeVariant(text)
+
+    return _FakeGio, _FakeGLib
+
+
+def test_system_proxy_apply_and_restore_gio_backend(tmp_path, monkeypatch) -> None:
+    # Textual GVariant form, as Gio's print_(False) would render it.
+    store: dict[tuple[str, str], str] = {
+        ("org.gnome.system.proxy", "mode"): "'none'",
+        ("org.gnome.system.proxy", "ignore-hosts"): "['localhost']",
+        ("org.gnome.system.proxy", "use-same-proxy"): "false",
+        ("org.gnome.system.proxy.http", "enabled"): "false",
+        ("org.gnome.system.proxy.http", "host"): "''",
+        ("org.gnome.system.proxy.http", "port"): "0",
+        ("org.gnome.system.proxy.https", "host"): "''",
+        ("org.gnome.system.proxy.https", "port"): "0",
+        ("org.gnome.system.proxy.socks", "host"): "''",
+        ("org.gnome.system.proxy.socks", "port"): "0",
+    }
+    fake_gio, fake_glib = _make_fake_gio(store)
+    monkeypatch.setattr(pm, "Gio", fake_gio)
+    monkeypatch.setattr(pm, "GLib", fake_glib)
+    pm.invalidate_backend_cache()
+
+    # The CLI tools must never be consulted on this path.
+    monkeypatch.setattr(pm.shutil, "which", lambda _name: None)
+    monkeypatch.setattr(
+        pm.subprocess, "run", lambda *a, **k: pytest.fail(f"Unexpected subprocess: {a}")
+    )
+
+    mgr = SystemProxyManager(state_dir=tmp_path)
+    mgr.apply(
+        SystemProxyConfig(
+            http_host="127.0.0.1",
+            http_port=8080,
+            socks_host="127.0.0.1",
+            socks_port=1080,
+            bypass_hosts=("localhost", "127.0.0.0/8", "::1"),
+        )
+    )
+
+    snap_path = tmp_path / pm.SNAPSHOT_FILE
+    assert snap_path.exists()
+    assert store[("org.gnome.system.proxy", "mode")] == "'manual'"
+    assert store[("org.gnome.system.proxy.http", "host")] == "'127.0.0.1'"
+    assert store[("org.gnome.system.proxy.http", "port")] == "8080"
+    assert "'127.0.0.0/8'" in store[("org.gnome.system.proxy", "ignore-hosts")]
+
+    mgr.restore()
+    assert not snap_path.exists()
+    assert store[("org.gnome.system.proxy", "mode")] == "'none'"
+    assert store[("org.gnome.system.proxy", "ignore-hosts")] == "['localhost']"
+